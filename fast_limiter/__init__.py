@@ -1,4 +1,4 @@
-from .models import FastLimiter
+from .models import FastLimiter, PenaltyBox, WebSocketLimiter
 from .services import fast_limit
 
-__all__ = ["FastLimiter", "fast_limit"]
+__all__ = ["FastLimiter", "PenaltyBox", "WebSocketLimiter", "fast_limit"]
@@ -5,6 +5,7 @@ from pydantic import Field, RedisDsn
 class EnvSettings(BaseSettings):
     redis_url: RedisDsn = Field("redis://localhost", validation_alias="REDIS_URL")
     db_path: str = Field("rtl.db", validation_alias="DB_PATH")
+    sql_url: str = Field("sqlite+aiosqlite:///rtl.db", validation_alias="SQL_URL")
     model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8")
 
 
@@ -1,3 +1,5 @@
 from .fast_limiter import FastLimiter
+from .penalty_box import PenaltyBox
+from .websocket_limiter import ConnectionLimiter, WebSocketLimiter
 
-__all__ = ["FastLimiter"]
+__all__ = ["FastLimiter", "PenaltyBox", "ConnectionLimiter", "WebSocketLimiter"]
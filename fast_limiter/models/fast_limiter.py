@@ -1,24 +1,59 @@
 import time
+from typing import Callable, Optional, Sequence
 from fastapi import Request, HTTPException
 from starlette.status import HTTP_429_TOO_MANY_REQUESTS
+from ..policies import PolicyCache
 from ..storages import Storage
+from .penalty_box import PenaltyBox
+
+
+def route_policy_names(request: Request) -> Sequence[str]:
+    """
+    Returns the route template of the request (e.g., "/users/{user_id}") as its only policy name,
+    falling back to the URL path when the request was not matched to a route.
+
+    Args:
+        request (Request): The incoming HTTP request.
+
+    Returns:
+        Sequence[str]: The policy names to try.
+    """
+    route = request.scope.get("route")
+    return [getattr(route, "path", None) or request.url.path]
 
 
 class FastLimiter:
     """Rate limiter class for managing request rate limiting."""
 
-    def __init__(self, storage: Storage, limit: int, interval: int):
+    def __init__(
+        self,
+        storage: Storage,
+        limit: int,
+        interval: int,
+        penalty: Optional[PenaltyBox] = None,
+        policies: Optional[PolicyCache] = None,
+        policy_names: Optional[Callable[[Request], Sequence[str]]] = None,
+    ):
         """
         Initializes the FastLimiter.
 
         Args:
             storage (Storage): Instance of the storage to be used (e.g., RedisStorage or SQLiteStorage).
-            limit (int): Maximum number of requests allowed within the interval.
-            interval (int): Time interval in seconds during which requests are counted.
+            limit (int): Maximum number of requests allowed within the interval, unless a policy applies.
+            interval (int): Time interval in seconds during which requests are counted, unless a policy applies.
+            penalty (PenaltyBox, optional): Escalating ban policy applied to clients that keep
+                exceeding the limit. Banned clients are rejected before any storage I/O; call
+                `penalty.start()` on startup to share bans between workers.
+            policies (PolicyCache, optional): Cached policy store overriding `limit` and `interval` per request.
+            policy_names (Callable[[Request], Sequence[str]], optional): Returns the policy names to try for a
+                request, by priority (default: the matched route template).
         """
         self.storage = storage
         self.limit = limit
         self.interval = interval
+        self.penalty = penalty
+        self.policies = policies
+        self.policy_names = policy_names or route_policy_names
 
     async def __call__(self, request: Request):
         """
@@ -32,21 +67,39 @@ class FastLimiter:
                 with details about the time until reset.
         """
         client_ip = request.client.host
+
+        if self.penalty:
+            banned_until = self.penalty.banned_until(client_ip)
+            if banned_until:
+                self._reject(banned_until)
+
+        limit, interval = self.limit, self.interval
+        if self.policies:
+            policy = await self.policies.resolve(*self.policy_names(request))
+            if policy:
+                limit, interval = policy.limit, policy.interval
+
         key = f"{client_ip}:{request.url.path}"
         timestamp = await self.storage.get_timestamp(key)
 
-        if timestamp and (time.time() - timestamp) > self.interval:
+        if timestamp and (time.time() - timestamp) > interval:
             await self.storage.reset(key)
 
-        remaining = await self.storage.get_remaining(key, self.limit, self.interval)
+        remaining = await self.storage.get_remaining(key, limit, interval)
 
         if remaining <= 0:
-            reset_time = timestamp + self.interval
-            time_until_reset = max(0, reset_time - time.time())
-            raise HTTPException(
-                status_code=HTTP_429_TOO_MANY_REQUESTS,
-                detail=f"Too many requests, please try again later. Time until reset: {time_until_reset:.2f} seconds.",
-            )
+            reset_time = timestamp + interval
+            if self.penalty:
+                reset_time = await self.penalty.strike(client_ip) or reset_time
+            self._reject(reset_time)
 
         await self.storage.increment(key)
         await self.storage.set_timestamp(key)
+
+    def _reject(self, reset_time: float):
+        """Raises HTTP 429 Too Many Requests with the time until reset."""
+        time_until_reset = max(0, reset_time - time.time())
+        raise HTTPException(
+            status_code=HTTP_429_TOO_MANY_REQUESTS,
+            detail=f"Too many requests, please try again later. Time until reset: {time_until_reset:.2f} seconds.",
+        )
@@ -0,0 +1,103 @@
+import asyncio
+import logging
+import time
+from typing import Dict, Optional
+from ..storages import Storage
+
+logger = logging.getLogger(__name__)
+
+
+class PenaltyBox:
+    """Escalating ban policy for clients that repeatedly exceed their rate limits."""
+
+    def __init__(
+        self,
+        storage: Storage,
+        threshold: int = 3,
+        ban: int = 60,
+        max_ban: int = 3600,
+        refresh_interval: float = 10.0,
+    ):
+        """
+        Initializes the PenaltyBox.
+
+        Args:
+            storage (Storage): Instance of the storage where strikes and bans are shared between workers.
+            threshold (int): Number of rejected requests that triggers a ban (default: 3).
+            ban (int): Duration in seconds of the first ban, doubled on each following ban (default: 60).
+            max_ban (int): Maximum ban duration in seconds. Strikes are also forgotten after this long
+                without a rejected request (default: 3600).
+            refresh_interval (float): Seconds between two reloads of the bans issued by other workers,
+                once `start` has been called (default: 10.0).
+        """
+        self.storage = storage
+        self.threshold = threshold
+        self.ban = ban
+        self.max_ban = max_ban
+        self.refresh_interval = refresh_interval
+        self.bans: Dict[str, float] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    def banned_until(self, client: str) -> Optional[float]:
+        """
+        Checks the local ban list, without any storage I/O.
+
+        Args:
+            client (str): Client identifier (e.g., the client IP).
+
+        Returns:
+            Optional[float]: The time at which the ban ends, or None if the client is not banned.
+        """
+        expires = self.bans.get(client)
+        if expires is not None and expires > time.time():
+            return expires
+        return None
+
+    async def refresh(self):
+        """Reloads the active bans from the storage."""
+        self.bans = await self.storage.get_bans()
+
+    async def start(self):
+        """Starts reloading the bans every `refresh_interval` in a background task."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._poll())
+
+    async def stop(self):
+        """Stops reloading the bans."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _poll(self):
+        """Reloads the bans forever, logging failures and keeping the last known bans."""
+        while True:
+            try:
+                await self.refresh()
+            except Exception:
+                logger.exception("Failed to reload bans from the storage")
+            await asyncio.sleep(self.refresh_interval)
+
+    async def strike(self, client: str) -> Optional[float]:
+        """
+        Records a rejected request and bans the client once it reaches the threshold. Requests rejected
+        while a ban is active in the storage, e.g. by a worker that has not reloaded it yet, are not counted.
+
+        Args:
+            client (str): Client identifier (e.g., the client IP).
+
+        Returns:
+            Optional[float]: The time at which the new ban ends, or None if the client was not banned.
+        """
+        strikes = await self.storage.add_strike(client, self.max_ban)
+
+        if not strikes or strikes % self.threshold:
+            return None
+
+        duration = min(self.ban * 2 ** (strikes // self.threshold - 1), self.max_ban)
+        await self.storage.add_ban(client, duration)
+        self.bans[client] = time.time() + duration
+        return self.bans[client]
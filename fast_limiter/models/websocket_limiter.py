@@ -0,0 +1,140 @@
+import math
+import time
+from typing import Optional
+from fastapi import WebSocket, WebSocketException
+from starlette.status import WS_1008_POLICY_VIOLATION
+from ..storages import Storage
+
+
+class ConnectionLimiter:
+    """Message rate limiter bound to a single WebSocket connection."""
+
+    def __init__(self, limiter: "WebSocketLimiter", key: str):
+        """
+        Initializes the ConnectionLimiter.
+
+        Args:
+            limiter (WebSocketLimiter): The limiter holding the limits and the shared storage.
+            key (str): Storage key shared by every connection of the same client and path.
+        """
+        self.limiter = limiter
+        self.key = key
+        self.tokens = float(limiter.connection_limit)
+        self.refilled_at = time.monotonic()
+        self.synced_at = -math.inf
+        self.shared_remaining = 0
+        self.pending = 0
+
+    async def __aenter__(self) -> "ConnectionLimiter":
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.flush()
+
+    async def __call__(self):
+        """
+        Consumes one message from the connection and key budgets.
+
+        The connection budget is a local token bucket. The key budget is read from and written to the
+        shared storage at most once per `sync_interval`, so consecutive messages cost no storage I/O.
+        Other connections of the same key are not seen until the next sync.
+
+        Raises:
+            WebSocketException: If either limit has been exceeded, with a 1008 Policy Violation close code.
+        """
+        now = time.monotonic()
+        if now - self.synced_at >= self.limiter.sync_interval:
+            await self.sync()
+            self.synced_at = now
+
+        rate = self.limiter.connection_limit / self.limiter.interval
+        self.tokens = min(
+            self.limiter.connection_limit,
+            self.tokens + (now - self.refilled_at) * rate,
+        )
+        self.refilled_at = now
+
+        if self.tokens < 1 or self.shared_remaining <= 0:
+            raise WebSocketException(
+                code=WS_1008_POLICY_VIOLATION,
+                reason="Too many messages, please try again later.",
+            )
+
+        self.tokens -= 1
+        self.shared_remaining -= 1
+        self.pending += 1
+
+    async def sync(self):
+        """
+        Pushes the messages counted locally since the last sync to the shared storage
+        and refreshes the remaining key budget.
+        """
+        storage = self.limiter.storage
+        timestamp = await storage.get_timestamp(self.key)
+
+        if timestamp and (time.time() - timestamp) > self.limiter.interval:
+            await storage.reset(self.key)
+
+        await self.flush()
+        self.shared_remaining = await storage.get_remaining(
+            self.key, self.limiter.limit, self.limiter.interval
+        )
+
+    async def flush(self):
+        """Writes the messages counted locally since the last sync to the shared storage."""
+        if self.pending:
+            await self.limiter.storage.increment(self.key, self.pending)
+            await self.limiter.storage.set_timestamp(self.key)
+            self.pending = 0
+
+
+class WebSocketLimiter:
+    """
+    Rate limiter for incoming WebSocket messages, per connection and per client key.
+
+    The per-key limit is approximate: each connection reads the remaining key budget on sync and spends
+    it locally until its next sync. With N concurrent connections on the same client and path, up to
+    N times `limit` messages can be accepted within one `sync_interval`; lower `sync_interval` to
+    tighten the bound at the cost of more storage round trips.
+    """
+
+    def __init__(
+        self,
+        storage: Storage,
+        limit: int,
+        interval: int,
+        connection_limit: Optional[int] = None,
+        sync_interval: float = 1.0,
+    ):
+        """
+        Initializes the WebSocketLimiter.
+
+        Args:
+            storage (Storage): Instance of the storage to be used (e.g., RedisStorage or SQLiteStorage).
+            limit (int): Maximum number of messages allowed per client and path within the interval.
+            interval (int): Time interval in seconds during which messages are counted.
+            connection_limit (int, optional): Maximum number of messages allowed per connection within
+                the interval, enforced locally (default: `limit`).
+            sync_interval (float): Minimum number of seconds between two storage round trips of a
+                connection (default: 1.0). Concurrent connections of the same key can overshoot
+                `limit` until their next sync.
+        """
+        self.storage = storage
+        self.limit = limit
+        self.interval = interval
+        self.connection_limit = connection_limit or limit
+        self.sync_interval = sync_interval
+
+    def connect(self, websocket: WebSocket) -> ConnectionLimiter:
+        """
+        Creates the limiter for a new WebSocket connection.
+
+        Args:
+            websocket (WebSocket): The incoming WebSocket connection.
+
+        Returns:
+            ConnectionLimiter: Callable to await once per received message. Used as an async
+                context manager, it flushes the pending count to the storage on exit.
+        """
+        client_ip = websocket.client.host
+        return ConnectionLimiter(self, f"{client_ip}:{websocket.url.path}")
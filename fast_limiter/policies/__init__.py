@@ -0,0 +1,14 @@
+from .cache import PolicyCache
+from .file import FilePolicyStore
+from .policy_store import Policy, PolicyStore
+from .redis import RedisPolicyStore
+from .sql import SQLPolicyStore
+
+__all__ = [
+    "FilePolicyStore",
+    "Policy",
+    "PolicyCache",
+    "PolicyStore",
+    "RedisPolicyStore",
+    "SQLPolicyStore",
+]
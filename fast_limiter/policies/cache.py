@@ -0,0 +1,180 @@
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from typing import Dict, Hashable, Optional, Tuple
+from .policy_store import Policy, PolicyStore
+
+logger = logging.getLogger(__name__)
+
+RELOAD_BATCH_SIZE = 100
+
+
+class PolicyCache:
+    """
+    In-process LRU cache in front of a policy store, reloaded in the background when the store changes.
+
+    Requests only wait on the store the first time a name is seen; concurrent misses for the same name
+    share a single load.
+    """
+
+    def __init__(
+        self,
+        store: PolicyStore,
+        default: Optional[Policy] = None,
+        ttl: float = 60.0,
+        maxsize: int = 10000,
+        poll_interval: float = 1.0,
+        max_backoff: float = 60.0,
+    ):
+        """
+        Initializes the PolicyCache.
+
+        Args:
+            store (PolicyStore): The source of the policies (e.g., FilePolicyStore or RedisPolicyStore).
+            default (Policy, optional): Policy returned when no name resolves (default: None).
+            ttl (float): Seconds after which a cached policy, or its absence, is reloaded in the background
+                on its next use. Only applies while the cache is not watching the store (default: 60.0).
+            maxsize (int): Maximum number of cached names, the least recently used are evicted (default: 10000).
+            poll_interval (float): Seconds between two version checks for stores without push
+                notifications, and first delay before watching again after a failure (default: 1.0).
+            max_backoff (float): Maximum delay in seconds before watching again after repeated
+                failures (default: 60.0).
+        """
+        self.store = store
+        self.default = default
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.poll_interval = poll_interval
+        self.max_backoff = max_backoff
+        self.version: Optional[Hashable] = None
+        self._generation = 0
+        self._entries: "OrderedDict[str, Tuple[float, Optional[Policy]]]" = OrderedDict()
+        self._loading: Dict[str, asyncio.Task] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    async def resolve(self, *names: str) -> Optional[Policy]:
+        """
+        Returns the policy of the first name that has one, served from the cache when possible.
+
+        Args:
+            *names (str): Policy names by priority (e.g., the API key, then the tenant, then the route).
+
+        Returns:
+            Optional[Policy]: The first matching policy, or the default policy.
+        """
+        for name in names:
+            policy = await self.get(name)
+            if policy is not None:
+                return policy
+        return self.default
+
+    async def get(self, name: str) -> Optional[Policy]:
+        """
+        Returns the policy registered under the given name, loading it from the store on a cache miss.
+
+        Args:
+            name (str): Policy name (e.g., a tenant, an API key or a route).
+
+        Returns:
+            Optional[Policy]: The policy, or None if not set.
+        """
+        entry = self._entries.get(name)
+        if entry is not None:
+            self._entries.move_to_end(name)
+            expires, policy = entry
+            if self._task is None and expires <= time.monotonic():
+                self._load(name)
+            return policy
+        return await asyncio.shield(self._load(name))
+
+    def _load(self, name: str) -> asyncio.Task:
+        """Starts loading a policy from the store, or returns the load already in flight."""
+        task = self._loading.get(name)
+        if task is None:
+            task = asyncio.create_task(self._fetch(name))
+            self._loading[name] = task
+            task.add_done_callback(lambda done: self._loaded(name, done))
+        return task
+
+    def _loaded(self, name: str, task: asyncio.Task):
+        """Forgets a finished load and logs its failure."""
+        if self._loading.get(name) is task:
+            del self._loading[name]
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning("Failed to load policy %r: %s", name, task.exception())
+
+    async def _fetch(self, name: str) -> Optional[Policy]:
+        """Reads a policy from the store and caches it, unless the cache changed version meanwhile."""
+        generation = self._generation
+        policy = await self.store.get_policy(name)
+        if generation == self._generation:
+            self._entries[name] = (time.monotonic() + self.ttl, policy)
+            self._entries.move_to_end(name)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return policy
+
+    async def reload(self, version: Optional[Hashable] = None):
+        """
+        Reloads every cached policy from the store, serving the previous ones until they are replaced.
+
+        Args:
+            version (Hashable, optional): The store version that triggered the reload.
+        """
+        self._generation += 1
+        generation = self._generation
+        names = list(self._entries)
+        for start in range(0, len(names), RELOAD_BATCH_SIZE):
+            batch = names[start : start + RELOAD_BATCH_SIZE]
+            policies = await asyncio.gather(*(self.store.get_policy(name) for name in batch))
+            if generation != self._generation:
+                return
+            for name, policy in zip(batch, policies):
+                if name in self._entries:
+                    self._entries[name] = (time.monotonic() + self.ttl, policy)
+        self.version = version
+
+    def invalidate(self, version: Optional[Hashable] = None):
+        """
+        Drops every cached policy.
+
+        Args:
+            version (Hashable, optional): The store version that triggered the invalidation.
+        """
+        self._entries.clear()
+        self._generation += 1
+        self.version = version
+
+    async def start(self):
+        """Starts listening to the store for changes in a background task."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._watch())
+
+    async def stop(self):
+        """Stops listening to the store for changes."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _watch(self):
+        """
+        Reloads the cache on every new store version. If watching fails, logs the error and watches
+        again with exponential backoff; the store yields its current version first, which catches up
+        with the changes missed in between.
+        """
+        delay = self.poll_interval
+        while True:
+            try:
+                async for version in self.store.watch(self.poll_interval):
+                    delay = self.poll_interval
+                    if version != self.version:
+                        await self.reload(version)
+            except Exception:
+                logger.exception("Failed to watch the policy store, retrying in %.1f seconds", delay)
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, self.max_backoff)
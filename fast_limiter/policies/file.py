@@ -0,0 +1,131 @@
+import json
+import os
+from typing import AsyncIterator, Dict, Hashable, Optional
+from watchfiles import awatch
+from ..exceptions import StorageError
+from .policy_store import Policy, PolicyStore
+
+
+class FilePolicyStore(PolicyStore):
+    """JSON file policy store, mapping each policy name to its rules."""
+
+    def __init__(self, path: str):
+        """
+        Initializes the file policy store.
+
+        Args:
+            path (str): Path to a JSON file such as `{"pro": {"limit": 100, "interval": 60}}`.
+        """
+        self.path = os.path.abspath(path)
+        self._policies: Dict[str, Policy] = {}
+        self._version: Optional[int] = None
+
+    def _load(self) -> Dict[str, Policy]:
+        """Reloads the file if it changed since the last read."""
+        version = self._stat()
+        if version != self._version:
+            policies = {}
+            if version:
+                with open(self.path, encoding="utf-8") as file:
+                    policies = {name: Policy(**rules) for name, rules in json.load(file).items()}
+            self._policies, self._version = policies, version
+        return self._policies
+
+    def _stat(self) -> int:
+        """Returns the modification time of the file in nanoseconds, or 0 if it does not exist."""
+        try:
+            return os.stat(self.path).st_mtime_ns
+        except FileNotFoundError:
+            return 0
+
+    def _dump(self, policies: Dict[str, Policy]):
+        """Atomically rewrites the file."""
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as file:
+            json.dump({name: policy.model_dump() for name, policy in policies.items()}, file, indent=2)
+        os.replace(tmp_path, self.path)
+
+    async def get_policy(self, name: str) -> Optional[Policy]:
+        """
+        Returns the policy registered under the given name.
+
+        Args:
+            name (str): Policy name (e.g., a tenant, an API key or a route).
+
+        Returns:
+            Optional[Policy]: The policy, or None if not set.
+
+        Raises:
+            StorageError: If the file cannot be read or parsed.
+        """
+        try:
+            return self._load().get(name)
+        except Exception as e:
+            raise StorageError(f"Error reading policy from file: {e}")
+
+    async def set_policy(self, name: str, policy: Policy):
+        """
+        Registers or replaces the policy for the given name.
+
+        Args:
+            name (str): Policy name (e.g., a tenant, an API key or a route).
+            policy (Policy): The rules to apply.
+
+        Raises:
+            StorageError: If the file cannot be read or written.
+        """
+        try:
+            self._dump({**self._load(), name: policy})
+        except Exception as e:
+            raise StorageError(f"Error writing policy to file: {e}")
+
+    async def delete_policy(self, name: str):
+        """
+        Removes the policy for the given name.
+
+        Args:
+            name (str): Policy name (e.g., a tenant, an API key or a route).
+
+        Raises:
+            StorageError: If the file cannot be read or written.
+        """
+        try:
+            policies = dict(self._load())
+            if policies.pop(name, None) is not None:
+                self._dump(policies)
+        except Exception as e:
+            raise StorageError(f"Error deleting policy from file: {e}")
+
+    async def get_version(self) -> Hashable:
+        """
+        Returns the modification time of the file in nanoseconds.
+
+        Returns:
+            Hashable: The current version of the store.
+        """
+        return self._stat()
+
+    async def watch(self, poll_interval: float = 1.0) -> AsyncIterator[Hashable]:
+        """
+        Yields the current version, then the new version each time the file changes,
+        using filesystem notifications.
+
+        Args:
+            poll_interval (float): Seconds after which the file is checked again without a notification,
+                covering changes made before the watcher was ready (default: 1.0).
+
+        Yields:
+            Hashable: The version of the store.
+        """
+        version = self._stat()
+        yield version
+        async for _ in awatch(
+            os.path.dirname(self.path),
+            rust_timeout=int(poll_interval * 1000),
+            yield_on_timeout=True,
+            recursive=False,
+        ):
+            current = self._stat()
+            if current != version:
+                version = current
+                yield version
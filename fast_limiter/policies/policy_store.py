@@ -0,0 +1,79 @@
+import asyncio
+from abc import ABC, abstractmethod
+from typing import AsyncIterator, Hashable, Optional
+from pydantic import BaseModel
+
+
+class Policy(BaseModel):
+    """Rate limit rules resolved for a tenant, API key or route."""
+
+    limit: int
+    interval: int
+
+
+class PolicyStore(ABC):
+    """Abstract base class for rate limit policy sources."""
+
+    @abstractmethod
+    async def get_policy(self, name: str) -> Optional[Policy]:
+        """
+        Returns the policy registered under the given name.
+
+        Args:
+            name (str): Policy name (e.g., a tenant, an API key or a route).
+
+        Returns:
+            Optional[Policy]: The policy, or None if not set.
+        """
+        ...
+
+    @abstractmethod
+    async def set_policy(self, name: str, policy: Policy):
+        """
+        Registers or replaces the policy for the given name and bumps the store version.
+
+        Args:
+            name (str): Policy name (e.g., a tenant, an API key or a route).
+            policy (Policy): The rules to apply.
+        """
+        ...
+
+    @abstractmethod
+    async def delete_policy(self, name: str):
+        """
+        Removes the policy for the given name and bumps the store version.
+
+        Args:
+            name (str): Policy name (e.g., a tenant, an API key or a route).
+        """
+        ...
+
+    @abstractmethod
+    async def get_version(self) -> Hashable:
+        """
+        Returns a cheap stamp that changes whenever any policy changes.
+
+        Returns:
+            Hashable: The current version of the store.
+        """
+        ...
+
+    async def watch(self, poll_interval: float = 1.0) -> AsyncIterator[Hashable]:
+        """
+        Yields the current version, then the new version each time the store changes.
+        Polls `get_version` by default.
+
+        Args:
+            poll_interval (float): Seconds between two version checks (default: 1.0).
+
+        Yields:
+            Hashable: The version of the store.
+        """
+        version = await self.get_version()
+        yield version
+        while True:
+            await asyncio.sleep(poll_interval)
+            current = await self.get_version()
+            if current != version:
+                version = current
+                yield version
@@ -0,0 +1,123 @@
+import redis.asyncio as aioredis
+from typing import AsyncIterator, Hashable, Optional
+from ..config import env_settings
+from ..exceptions import StorageError
+from .policy_store import Policy, PolicyStore
+
+
+class RedisPolicyStore(PolicyStore):
+    """Redis policy store, keeping every policy in a single hash."""
+
+    def __init__(self, url: str = env_settings.redis_url, prefix: str = "rtl-policies"):
+        """
+        Initializes the Redis policy store.
+
+        Args:
+            url (str): Connection URL for Redis (e.g., "redis://localhost").
+            prefix (str): Prefix for the keys in Redis, kept apart from the `RedisStorage` prefix so that
+                its admin scans never touch the policies (optional, default: "rtl-policies").
+        """
+        self.db = aioredis.from_url(url)
+        self.key = prefix
+        self.version_key = f"{prefix}:version"
+
+    async def get_policy(self, name: str) -> Optional[Policy]:
+        """
+        Returns the policy registered under the given name.
+
+        Args:
+            name (str): Policy name (e.g., a tenant, an API key or a route).
+
+        Returns:
+            Optional[Policy]: The policy, or None if not set.
+
+        Raises:
+            StorageError: If an error occurs while communicating with Redis.
+        """
+        try:
+            policy = await self.db.hget(self.key, name)
+            return Policy.model_validate_json(policy) if policy else None
+        except aioredis.RedisError as e:
+            raise StorageError(f"Error retrieving policy from Redis: {e}")
+
+    async def _bump(self, pipe):
+        """Increments the version and notifies the subscribers, within the given transaction."""
+        pipe.incr(self.version_key)
+        results = await pipe.execute()
+        await self.db.publish(self.key, results[-1])
+
+    async def set_policy(self, name: str, policy: Policy):
+        """
+        Registers or replaces the policy for the given name, then publishes the new version.
+
+        Args:
+            name (str): Policy name (e.g., a tenant, an API key or a route).
+            policy (Policy): The rules to apply.
+
+        Raises:
+            StorageError: If an error occurs while communicating with Redis.
+        """
+        try:
+            async with self.db.pipeline() as pipe:
+                pipe.hset(self.key, name, policy.model_dump_json())
+                await self._bump(pipe)
+        except aioredis.RedisError as e:
+            raise StorageError(f"Error setting policy in Redis: {e}")
+
+    async def delete_policy(self, name: str):
+        """
+        Removes the policy for the given name, then publishes the new version.
+
+        Args:
+            name (str): Policy name (e.g., a tenant, an API key or a route).
+
+        Raises:
+            StorageError: If an error occurs while communicating with Redis.
+        """
+        try:
+            async with self.db.pipeline() as pipe:
+                pipe.hdel(self.key, name)
+                await self._bump(pipe)
+        except aioredis.RedisError as e:
+            raise StorageError(f"Error deleting policy from Redis: {e}")
+
+    async def get_version(self) -> Hashable:
+        """
+        Returns the version counter of the policies.
+
+        Returns:
+            Hashable: The current version of the store.
+
+        Raises:
+            StorageError: If an error occurs while communicating with Redis.
+        """
+        try:
+            version = await self.db.get(self.version_key)
+            return int(version) if version else 0
+        except aioredis.RedisError as e:
+            raise StorageError(f"Error retrieving policy version from Redis: {e}")
+
+    async def watch(self, poll_interval: float = 1.0) -> AsyncIterator[Hashable]:
+        """
+        Yields the current version once subscribed, then the new version each time a policy changes,
+        using Redis pub/sub.
+
+        Args:
+            poll_interval (float): Unused, changes are pushed by Redis.
+
+        Yields:
+            Hashable: The version of the store.
+
+        Raises:
+            StorageError: If an error occurs while communicating with Redis.
+        """
+        try:
+            async with self.db.pubsub() as pubsub:
+                await pubsub.subscribe(self.key)
+                async for message in pubsub.listen():
+                    if message["type"] == "subscribe":
+                        yield await self.get_version()
+                    elif message["type"] == "message":
+                        yield int(message["data"])
+        except aioredis.RedisError as e:
+            raise StorageError(f"Error watching policies in Redis: {e}")
@@ -1,5 +1,6 @@
 from .redis import RedisStorage
+from .sql import SQLStorage
 from .sqlite import SQLiteStorage
-from .storage import Storage
+from .storage import KeyState, Storage
 
-__all__ = ["RedisStorage", "SQLiteStorage", "Storage"]
+__all__ = ["KeyState", "RedisStorage", "SQLStorage", "SQLiteStorage", "Storage"]
@@ -1,9 +1,21 @@
+import heapq
 import redis.asyncio as aioredis
 import time
-from typing import Optional
+from typing import AsyncIterable, AsyncIterator, Dict, Iterable, List, Optional, Union
 from ..config import env_settings
 from ..exceptions import StorageError
-from .storage import Storage
+from .storage import KeyState, Storage, iter_batches
+
+
+STRIKE_SCRIPT = """
+local banned_until = redis.call("ZSCORE", KEYS[1], ARGV[1])
+if banned_until and tonumber(banned_until) > tonumber(ARGV[2]) then
+    return 0
+end
+local strikes = redis.call("INCR", KEYS[2])
+redis.call("EXPIRE", KEYS[2], ARGV[3])
+return strikes
+"""
 
 
 class RedisStorage(Storage):
@@ -19,11 +31,31 @@ class RedisStorage(Storage):
         """
         self.db = aioredis.from_url(url)
         self.prefix = prefix
+        self.penalty_prefix = f"{prefix}-penalty"
+        self._strike = self.db.register_script(STRIKE_SCRIPT)
 
     def _key(self, key: str) -> str:
         """Generates the full Redis key."""
         return f"{self.prefix}:{key}"
 
+    def _unkey(self, name: bytes) -> str:
+        """Strips the prefix from a raw Redis key name."""
+        return name.decode()[len(self.prefix) + 1 :]
+
+    async def _scan_batches(self, pattern: str, batch_size: int) -> AsyncIterator[List[str]]:
+        """Yields batches of counter keys (without prefix) matching the pattern, using SCAN."""
+        batch = []
+        async for name in self.db.scan_iter(match=self._key(pattern), count=batch_size):
+            key = self._unkey(name)
+            if key.endswith("_ts"):
+                continue
+            batch.append(key)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
     async def increment(self, key: str, increment: int = 1) -> int:
         """
         Increments the counter for the given key and returns the new value.
@@ -112,3 +144,193 @@ class RedisStorage(Storage):
             await self.db.set(self._key(key) + "_ts", time.time())
         except aioredis.RedisError as e:
             raise StorageError(f"Error setting timestamp in Redis: {e}")
+
+    async def scan_keys(self, pattern: str = "*", batch_size: int = 500) -> AsyncIterator[str]:
+        """
+        Iterates incrementally over the keys matching a glob pattern, using SCAN.
+
+        Args:
+            pattern (str): Glob-style pattern matched against the keys (default: "*").
+            batch_size (int): SCAN COUNT hint (default: 500).
+
+        Yields:
+            str: Each matching key.
+
+        Raises:
+            StorageError: If an error occurs while communicating with Redis.
+        """
+        try:
+            async for batch in self._scan_batches(pattern, batch_size):
+                for key in batch:
+                    yield key
+        except aioredis.RedisError as e:
+            raise StorageError(f"Error scanning keys in Redis: {e}")
+
+    async def inspect(self, pattern: str = "*", batch_size: int = 500) -> AsyncIterator[KeyState]:
+        """
+        Iterates over the state of the keys matching a glob pattern, reading each batch with one MGET.
+
+        Args:
+            pattern (str): Glob-style pattern matched against the keys (default: "*").
+            batch_size (int): Number of keys scanned and read per round trip (default: 500).
+
+        Yields:
+            KeyState: The stored state of each matching key.
+
+        Raises:
+            StorageError: If an error occurs while communicating with Redis.
+        """
+        try:
+            async for batch in self._scan_batches(pattern, batch_size):
+                names = [self._key(key) for key in batch]
+                values = await self.db.mget(names + [name + "_ts" for name in names])
+                counts, timestamps = values[: len(batch)], values[len(batch) :]
+                for key, count, timestamp in zip(batch, counts, timestamps):
+                    if count is None:
+                        continue
+                    yield KeyState(
+                        key=key,
+                        count=int(count),
+                        timestamp=float(timestamp) if timestamp else None,
+                    )
+        except aioredis.RedisError as e:
+            raise StorageError(f"Error inspecting keys in Redis: {e}")
+
+    async def reset_many(self, pattern: str, batch_size: int = 500) -> int:
+        """
+        Resets every key matching a glob pattern, unlinking each scanned batch at once.
+
+        Args:
+            pattern (str): Glob-style pattern matched against the keys.
+            batch_size (int): Number of keys scanned and removed per round trip (default: 500).
+
+        Returns:
+            int: The number of keys that were reset.
+
+        Raises:
+            StorageError: If an error occurs while communicating with Redis.
+        """
+        try:
+            total = 0
+            async for batch in self._scan_batches(pattern, batch_size):
+                names = [self._key(key) for key in batch]
+                await self.db.unlink(*names, *[name + "_ts" for name in names])
+                total += len(batch)
+            return total
+        except aioredis.RedisError as e:
+            raise StorageError(f"Error resetting keys in Redis: {e}")
+
+    async def top_keys(self, n: int = 10, pattern: str = "*") -> List[KeyState]:
+        """
+        Returns the keys with the highest counters, keeping only `n` candidates in memory.
+
+        Args:
+            n (int): Maximum number of keys to return (default: 10).
+            pattern (str): Glob-style pattern matched against the keys (default: "*").
+
+        Returns:
+            List[KeyState]: The hottest keys, ordered by descending count.
+
+        Raises:
+            StorageError: If an error occurs while communicating with Redis.
+        """
+        heap = []
+        async for state in self.inspect(pattern):
+            entry = (state.count, state.key, state)
+            if len(heap) < n:
+                heapq.heappush(heap, entry)
+            elif entry[:2] > heap[0][:2]:
+                heapq.heapreplace(heap, entry)
+        return [state for _, _, state in sorted(heap, key=lambda e: e[:2], reverse=True)]
+
+    async def import_state(
+        self, states: Union[Iterable[KeyState], AsyncIterable[KeyState]], batch_size: int = 500
+    ) -> int:
+        """
+        Restores a snapshot produced by `export_state`, writing each batch in one pipeline.
+
+        Args:
+            states (Union[Iterable[KeyState], AsyncIterable[KeyState]]): The key states to restore.
+            batch_size (int): Number of keys written per round trip (default: 500).
+
+        Returns:
+            int: The number of keys that were restored.
+
+        Raises:
+            StorageError: If an error occurs while communicating with Redis.
+        """
+        try:
+            total = 0
+            async for batch in iter_batches(states, batch_size):
+                async with self.db.pipeline(transaction=False) as pipe:
+                    for state in batch:
+                        name = self._key(state.key)
+                        pipe.set(name, state.count)
+                        if state.timestamp is None:
+                            pipe.delete(name + "_ts")
+                        else:
+                            pipe.set(name + "_ts", state.timestamp)
+                    await pipe.execute()
+                total += len(batch)
+            return total
+        except aioredis.RedisError as e:
+            raise StorageError(f"Error importing state into Redis: {e}")
+
+    async def add_strike(self, client: str, window: int) -> int:
+        """
+        Counts a rejected request of a client in a key expiring `window` seconds after the last strike.
+        The ban check and the increment run atomically in a Lua script.
+
+        Args:
+            client (str): Client identifier (e.g., the client IP).
+            window (int): Seconds after the last strike at which the strikes are forgotten.
+
+        Returns:
+            int: The number of strikes of the client, including this one, or 0 if the client is banned.
+
+        Raises:
+            StorageError: If an error occurs while communicating with Redis.
+        """
+        try:
+            return await self._strike(
+                keys=[f"{self.penalty_prefix}:bans", f"{self.penalty_prefix}:strikes:{client}"],
+                args=[client, time.time(), window],
+            )
+        except aioredis.RedisError as e:
+            raise StorageError(f"Error adding strike in Redis: {e}")
+
+    async def add_ban(self, client: str, duration: int):
+        """
+        Bans a client by adding it to a sorted set scored by the time at which the ban ends.
+
+        Args:
+            client (str): Client identifier (e.g., the client IP).
+            duration (int): Ban duration in seconds.
+
+        Raises:
+            StorageError: If an error occurs while communicating with Redis.
+        """
+        try:
+            await self.db.zadd(f"{self.penalty_prefix}:bans", {client: time.time() + duration})
+        except aioredis.RedisError as e:
+            raise StorageError(f"Error adding ban in Redis: {e}")
+
+    async def get_bans(self) -> Dict[str, float]:
+        """
+        Returns the active bans, removing the expired ones from the sorted set in the same round trip.
+
+        Returns:
+            Dict[str, float]: The time at which the ban ends, by client.
+
+        Raises:
+            StorageError: If an error occurs while communicating with Redis.
+        """
+        try:
+            name = f"{self.penalty_prefix}:bans"
+            async with self.db.pipeline() as pipe:
+                pipe.zremrangebyscore(name, "-inf", time.time())
+                pipe.zrange(name, 0, -1, withscores=True)
+                _, bans = await pipe.execute()
+            return {client.decode(): expires for client, expires in bans}
+        except aioredis.RedisError as e:
+            raise StorageError(f"Error retrieving bans from Redis: {e}")
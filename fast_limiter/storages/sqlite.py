@@ -1,15 +1,24 @@
+import asyncio
 import time
-from sqlmodel import Field, SQLModel, create_engine, Session
-from typing import Optional
+from sqlalchemy import Double
+from sqlmodel import Field, SQLModel, create_engine, delete, select, Session
+from typing import AsyncIterable, AsyncIterator, Dict, Iterable, List, Optional, Union
 from ..config import env_settings
 from ..exceptions import StorageError
-from .storage import Storage
+from .storage import KeyState, Storage, iter_batches
 
 
 class SQLRateLimit(SQLModel, table=True):
     key: str = Field(primary_key=True)
-    count: int = Field(default=0)
-    timestamp: float = Field(default=time.time())
+    count: int = Field(default=0, index=True)
+    timestamp: float = Field(default=time.time(), index=True, sa_type=Double)
+
+
+class SQLPenalty(SQLModel, table=True):
+    client: str = Field(primary_key=True)
+    strikes: int = Field(default=0)
+    strikes_expire_at: float = Field(default=0, sa_type=Double)
+    banned_until: float = Field(default=0, index=True, sa_type=Double)
 
 
 class SQLiteStorage(Storage):
@@ -145,6 +154,233 @@ class SQLiteStorage(Storage):
         except Exception as e:
             raise StorageError(f"Error setting timestamp in SQLite: {e}")
 
+    async def _scan_batches(self, pattern: str, batch_size: int) -> AsyncIterator[List[SQLRateLimit]]:
+        """
+        Yields batches of rows matching the pattern using keyset pagination on the primary key,
+        releasing the event loop between batches.
+        """
+        last_key = None
+        while True:
+            statement = select(SQLRateLimit).where(SQLRateLimit.key.op("GLOB")(pattern))
+            if last_key is not None:
+                statement = statement.where(SQLRateLimit.key > last_key)
+            statement = statement.order_by(SQLRateLimit.key).limit(batch_size)
+            with self.session:
+                batch = list(self.session.exec(statement))
+            if not batch:
+                return
+            yield batch
+            if len(batch) < batch_size:
+                return
+            last_key = batch[-1].key
+            await asyncio.sleep(0)
+
+    async def scan_keys(self, pattern: str = "*", batch_size: int = 500) -> AsyncIterator[str]:
+        """
+        Iterates incrementally over the keys matching a glob pattern.
+
+        Args:
+            pattern (str): Glob-style pattern matched against the keys (default: "*").
+            batch_size (int): Number of rows fetched per query (default: 500).
+
+        Yields:
+            str: Each matching key.
+
+        Raises:
+            StorageError: If an error occurs while interacting with the SQLite database.
+        """
+        try:
+            async for batch in self._scan_batches(pattern, batch_size):
+                for rate_limit in batch:
+                    yield rate_limit.key
+        except Exception as e:
+            raise StorageError(f"Error scanning keys in SQLite: {e}")
+
+    async def inspect(self, pattern: str = "*", batch_size: int = 500) -> AsyncIterator[KeyState]:
+        """
+        Iterates incrementally over the state of the keys matching a glob pattern.
+
+        Args:
+            pattern (str): Glob-style pattern matched against the keys (default: "*").
+            batch_size (int): Number of rows fetched per query (default: 500).
+
+        Yields:
+            KeyState: The stored state of each matching key.
+
+        Raises:
+            StorageError: If an error occurs while interacting with the SQLite database.
+        """
+        try:
+            async for batch in self._scan_batches(pattern, batch_size):
+                for rate_limit in batch:
+                    yield KeyState(key=rate_limit.key, count=rate_limit.count, timestamp=rate_limit.timestamp)
+        except Exception as e:
+            raise StorageError(f"Error inspecting keys in SQLite: {e}")
+
+    async def reset_many(self, pattern: str, batch_size: int = 500) -> int:
+        """
+        Resets every key matching a glob pattern, deleting one batch per transaction.
+
+        Args:
+            pattern (str): Glob-style pattern matched against the keys.
+            batch_size (int): Number of rows deleted per transaction (default: 500).
+
+        Returns:
+            int: The number of keys that were reset.
+
+        Raises:
+            StorageError: If an error occurs while interacting with the SQLite database.
+        """
+        try:
+            total = 0
+            async for batch in self._scan_batches(pattern, batch_size):
+                keys = [rate_limit.key for rate_limit in batch]
+                with self.session:
+                    self.session.exec(delete(SQLRateLimit).where(SQLRateLimit.key.in_(keys)))
+                    self.session.commit()
+                total += len(keys)
+            return total
+        except Exception as e:
+            raise StorageError(f"Error resetting keys in SQLite: {e}")
+
+    async def top_keys(self, n: int = 10, pattern: str = "*") -> List[KeyState]:
+        """
+        Returns the keys with the highest counters, using the index on the count column.
+
+        Args:
+            n (int): Maximum number of keys to return (default: 10).
+            pattern (str): Glob-style pattern matched against the keys (default: "*").
+
+        Returns:
+            List[KeyState]: The hottest keys, ordered by descending count.
+
+        Raises:
+            StorageError: If an error occurs while interacting with the SQLite database.
+        """
+        try:
+            statement = (
+                select(SQLRateLimit)
+                .where(SQLRateLimit.key.op("GLOB")(pattern))
+                .order_by(SQLRateLimit.count.desc(), SQLRateLimit.key.desc())
+                .limit(n)
+            )
+            with self.session:
+                return [
+                    KeyState(key=rate_limit.key, count=rate_limit.count, timestamp=rate_limit.timestamp)
+                    for rate_limit in self.session.exec(statement)
+                ]
+        except Exception as e:
+            raise StorageError(f"Error retrieving top keys from SQLite: {e}")
+
+    async def import_state(
+        self, states: Union[Iterable[KeyState], AsyncIterable[KeyState]], batch_size: int = 500
+    ) -> int:
+        """
+        Restores a snapshot produced by `export_state`, committing one batch per transaction.
+
+        Args:
+            states (Union[Iterable[KeyState], AsyncIterable[KeyState]]): The key states to restore.
+            batch_size (int): Number of rows written per transaction (default: 500).
+
+        Returns:
+            int: The number of keys that were restored.
+
+        Raises:
+            StorageError: If an error occurs while interacting with the SQLite database.
+        """
+        try:
+            total = 0
+            async for batch in iter_batches(states, batch_size):
+                with self.session:
+                    for state in batch:
+                        self.session.merge(
+                            SQLRateLimit(
+                                key=state.key,
+                                count=state.count,
+                                timestamp=state.timestamp if state.timestamp is not None else time.time(),
+                            )
+                        )
+                    self.session.commit()
+                total += len(batch)
+                await asyncio.sleep(0)
+            return total
+        except Exception as e:
+            raise StorageError(f"Error importing state into SQLite: {e}")
+
+    async def add_strike(self, client: str, window: int) -> int:
+        """
+        Counts a rejected request of a client, in the penalty table.
+
+        Args:
+            client (str): Client identifier (e.g., the client IP).
+            window (int): Seconds after the last strike at which the strikes are forgotten.
+
+        Returns:
+            int: The number of strikes of the client, including this one, or 0 if the client is banned.
+
+        Raises:
+            StorageError: If an error occurs while interacting with the SQLite database.
+        """
+        try:
+            now = time.time()
+            with self.session:
+                penalty = self.session.get(SQLPenalty, client) or SQLPenalty(client=client)
+                if penalty.banned_until > now:
+                    return 0
+                penalty.strikes = penalty.strikes + 1 if penalty.strikes_expire_at > now else 1
+                penalty.strikes_expire_at = now + window
+                self.session.add(penalty)
+                self.session.commit()
+                return penalty.strikes
+        except Exception as e:
+            raise StorageError(f"Error adding strike in SQLite: {e}")
+
+    async def add_ban(self, client: str, duration: int):
+        """
+        Bans a client, in the penalty table.
+
+        Args:
+            client (str): Client identifier (e.g., the client IP).
+            duration (int): Ban duration in seconds.
+
+        Raises:
+            StorageError: If an error occurs while interacting with the SQLite database.
+        """
+        try:
+            with self.session:
+                penalty = self.session.get(SQLPenalty, client) or SQLPenalty(client=client)
+                penalty.banned_until = time.time() + duration
+                self.session.add(penalty)
+                self.session.commit()
+        except Exception as e:
+            raise StorageError(f"Error adding ban in SQLite: {e}")
+
+    async def get_bans(self) -> Dict[str, float]:
+        """
+        Returns the active bans, deleting the clients whose strikes and ban have both expired.
+
+        Returns:
+            Dict[str, float]: The time at which the ban ends, by client.
+
+        Raises:
+            StorageError: If an error occurs while interacting with the SQLite database.
+        """
+        try:
+            now = time.time()
+            with self.session:
+                self.session.exec(
+                    delete(SQLPenalty).where(
+                        SQLPenalty.banned_until <= now, SQLPenalty.strikes_expire_at <= now
+                    )
+                )
+                self.session.commit()
+                bans = self.session.exec(
+                    select(SQLPenalty.client, SQLPenalty.banned_until).where(SQLPenalty.banned_until > now)
+                )
+                return dict(bans.all())
+        except Exception as e:
+            raise StorageError(f"Error retrieving bans from SQLite: {e}")
+
     def close(self):
         """
         Closes the SQLite connection.
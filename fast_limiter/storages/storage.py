@@ -1,5 +1,14 @@
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import AsyncIterable, AsyncIterator, Dict, Iterable, List, Optional, Union
+from pydantic import BaseModel
+
+
+class KeyState(BaseModel):
+    """Snapshot of the stored state for a single rate limit key."""
+
+    key: str
+    count: int = 0
+    timestamp: Optional[float] = None
 
 
 class Storage(ABC):
@@ -66,3 +75,155 @@ class Storage(ABC):
             key (str): Unique key to identify the rate limit.
         """
         ...
+
+    @abstractmethod
+    async def scan_keys(self, pattern: str = "*", batch_size: int = 500) -> AsyncIterator[str]:
+        """
+        Iterates incrementally over the keys matching a glob pattern.
+
+        Args:
+            pattern (str): Glob-style pattern matched against the keys (default: "*").
+            batch_size (int): Number of keys fetched from the backend per round trip (default: 500).
+
+        Yields:
+            str: Each matching key.
+        """
+        ...
+
+    @abstractmethod
+    async def inspect(self, pattern: str = "*", batch_size: int = 500) -> AsyncIterator[KeyState]:
+        """
+        Iterates incrementally over the state of the keys matching a glob pattern.
+
+        Args:
+            pattern (str): Glob-style pattern matched against the keys (default: "*").
+            batch_size (int): Number of keys fetched from the backend per round trip (default: 500).
+
+        Yields:
+            KeyState: The stored state of each matching key.
+        """
+        ...
+
+    @abstractmethod
+    async def reset_many(self, pattern: str, batch_size: int = 500) -> int:
+        """
+        Resets every key matching a glob pattern, in batches.
+
+        Args:
+            pattern (str): Glob-style pattern matched against the keys.
+            batch_size (int): Number of keys removed per round trip (default: 500).
+
+        Returns:
+            int: The number of keys that were reset.
+        """
+        ...
+
+    @abstractmethod
+    async def top_keys(self, n: int = 10, pattern: str = "*") -> List[KeyState]:
+        """
+        Returns the keys with the highest counters.
+
+        Args:
+            n (int): Maximum number of keys to return (default: 10).
+            pattern (str): Glob-style pattern matched against the keys (default: "*").
+
+        Returns:
+            List[KeyState]: The hottest keys, ordered by descending count.
+        """
+        ...
+
+    async def export_state(self, pattern: str = "*", batch_size: int = 500) -> AsyncIterator[KeyState]:
+        """
+        Streams a snapshot of the state of the keys matching a glob pattern.
+
+        Args:
+            pattern (str): Glob-style pattern matched against the keys (default: "*").
+            batch_size (int): Number of keys fetched from the backend per round trip (default: 500).
+
+        Yields:
+            KeyState: The stored state of each matching key.
+        """
+        async for state in self.inspect(pattern, batch_size):
+            yield state
+
+    @abstractmethod
+    async def import_state(
+        self, states: Union[Iterable[KeyState], AsyncIterable[KeyState]], batch_size: int = 500
+    ) -> int:
+        """
+        Restores a snapshot produced by `export_state`, overwriting existing keys.
+
+        Args:
+            states (Union[Iterable[KeyState], AsyncIterable[KeyState]]): The key states to restore.
+            batch_size (int): Number of keys written per round trip (default: 500).
+
+        Returns:
+            int: The number of keys that were restored.
+        """
+        ...
+
+    @abstractmethod
+    async def add_strike(self, client: str, window: int) -> int:
+        """
+        Counts a rejected request of a client, unless the client has an active ban.
+        Penalty state is kept apart from the rate limit keys.
+
+        Args:
+            client (str): Client identifier (e.g., the client IP).
+            window (int): Seconds after the last strike at which the strikes are forgotten.
+
+        Returns:
+            int: The number of strikes of the client, including this one, or 0 if the client is banned.
+        """
+        ...
+
+    @abstractmethod
+    async def add_ban(self, client: str, duration: int):
+        """
+        Bans a client, the ban expiring on its own after the duration.
+
+        Args:
+            client (str): Client identifier (e.g., the client IP).
+            duration (int): Ban duration in seconds.
+        """
+        ...
+
+    @abstractmethod
+    async def get_bans(self) -> Dict[str, float]:
+        """
+        Returns the active bans, dropping the expired ones from the storage.
+
+        Returns:
+            Dict[str, float]: The time at which the ban ends, by client.
+        """
+        ...
+
+
+async def iter_batches(
+    states: Union[Iterable[KeyState], AsyncIterable[KeyState]], batch_size: int
+) -> AsyncIterator[List[KeyState]]:
+    """
+    Groups a sync or async iterable of key states into lists of at most `batch_size` items.
+
+    Args:
+        states (Union[Iterable[KeyState], AsyncIterable[KeyState]]): The key states to group.
+        batch_size (int): Maximum size of each batch.
+
+    Yields:
+        List[KeyState]: Consecutive batches of key states.
+    """
+    batch = []
+    if hasattr(states, "__aiter__"):
+        async for state in states:
+            batch.append(state)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+    else:
+        for state in states:
+            batch.append(state)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+    if batch:
+        yield batch
@@ -0,0 +1,96 @@
+import asyncio
+import time
+import pytest
+import pytest_asyncio
+from fastapi.testclient import TestClient
+from fastapi import FastAPI, status, Depends
+from fast_limiter import FastLimiter, PenaltyBox
+from fast_limiter.storages import SQLiteStorage
+from unittest.mock import AsyncMock
+
+
+@pytest_asyncio.fixture
+async def sql_storage(tmpdir):
+    db_path = str(tmpdir.join("rtl.db"))
+    storage = SQLiteStorage(db_path=db_path)
+    yield storage
+    storage.close()
+
+
+@pytest.mark.asyncio
+async def test_penalty_box_escalating_bans(key: str, sql_storage: SQLiteStorage):
+    penalty = PenaltyBox(sql_storage, threshold=2, ban=10, max_ban=30)
+    assert await penalty.strike(key) is None
+    assert penalty.banned_until(key) is None
+    first_ban = await penalty.strike(key)
+    assert abs(first_ban - time.time() - 10) < 1
+    await sql_storage.add_ban(key, -1)  # the ban runs out
+    await penalty.strike(key)
+    second_ban = await penalty.strike(key)
+    assert abs(second_ban - time.time() - 20) < 1
+    await sql_storage.add_ban(key, -1)
+    await penalty.strike(key)
+    assert abs(await penalty.strike(key) - time.time() - 30) < 1
+
+
+@pytest.mark.asyncio
+async def test_penalty_box_no_escalation_during_ban(key: str, sql_storage: SQLiteStorage):
+    worker_a = PenaltyBox(sql_storage, threshold=3, ban=60, max_ban=3600)
+    worker_b = PenaltyBox(sql_storage, threshold=3, ban=60, max_ban=3600)
+    for _ in range(3):
+        await worker_a.strike(key)
+    assert worker_a.banned_until(key) is not None
+    for _ in range(15):
+        assert await worker_b.strike(key) is None
+    bans = await sql_storage.get_bans()
+    assert abs(bans[key] - time.time() - 60) < 1
+
+
+@pytest.mark.asyncio
+async def test_penalty_box_refresh_shares_bans(key: str, sql_storage: SQLiteStorage):
+    await PenaltyBox(sql_storage, threshold=1).strike(key)
+    other_worker = PenaltyBox(sql_storage, threshold=1)
+    assert other_worker.banned_until(key) is None
+    await other_worker.refresh()
+    assert other_worker.banned_until(key) is not None
+
+
+@pytest.mark.asyncio
+async def test_penalty_box_background_refresh(key: str, sql_storage: SQLiteStorage):
+    other_worker = PenaltyBox(sql_storage, threshold=1, refresh_interval=0.05)
+    await other_worker.start()
+    try:
+        await PenaltyBox(sql_storage, threshold=1).strike(key)
+        await asyncio.sleep(0.2)
+        assert other_worker.banned_until(key) is not None
+    finally:
+        await other_worker.stop()
+
+
+@pytest.mark.asyncio
+async def test_penalty_box_outside_rate_limit_keys(key: str, sql_storage: SQLiteStorage):
+    await sql_storage.increment("10.0.0.1:/a", 50)
+    await PenaltyBox(sql_storage, threshold=1).strike(key)
+    assert [state.key for state in await sql_storage.top_keys()] == ["10.0.0.1:/a"]
+
+
+@pytest.mark.asyncio
+async def test_penalty_box_rejects_before_storage(sql_storage: SQLiteStorage):
+    mock_storage = AsyncMock()
+    mock_storage.get_timestamp.return_value = time.time()
+    mock_storage.get_remaining.return_value = 0
+    limiter = FastLimiter(mock_storage, limit=3, interval=5, penalty=PenaltyBox(sql_storage, threshold=2))
+
+    app = FastAPI()
+
+    @app.get("/penalty", dependencies=[Depends(limiter)])
+    async def penalty_route():
+        return {"detail": "Welcome to penalty route"}
+
+    client = TestClient(app)
+    for _ in range(2):
+        assert client.get("/penalty").status_code == status.HTTP_429_TOO_MANY_REQUESTS
+    mock_storage.reset_mock()
+    response = client.get("/penalty")
+    assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+    mock_storage.get_remaining.assert_not_awaited()
@@ -0,0 +1,242 @@
+import asyncio
+import pytest
+import pytest_asyncio
+from fastapi.testclient import TestClient
+from fastapi import FastAPI, Depends
+from fast_limiter import FastLimiter
+from fast_limiter.exceptions import StorageError
+from fast_limiter.policies import FilePolicyStore, Policy, PolicyCache, PolicyStore, SQLPolicyStore
+from fast_limiter.storages import SQLiteStorage
+from unittest.mock import AsyncMock
+
+
+@pytest_asyncio.fixture
+async def sql_store(tmpdir):
+    db_path = str(tmpdir.join("rtl.db"))
+    store = SQLPolicyStore(url=f"sqlite+aiosqlite:///{db_path}")
+    yield store
+    await store.close()
+
+
+@pytest_asyncio.fixture(params=["file", "sql"])
+async def store(request, tmpdir):
+    if request.param == "file":
+        yield FilePolicyStore(str(tmpdir.join("policies.json")))
+    else:
+        store = SQLPolicyStore(url=f"sqlite+aiosqlite:///{tmpdir.join('rtl.db')}")
+        yield store
+        await store.close()
+
+
+@pytest.mark.asyncio
+async def test_policy_store_set_get_delete(store):
+    assert await store.get_policy("pro") is None
+    version = await store.get_version()
+    await store.set_policy("pro", Policy(limit=100, interval=60))
+    assert await store.get_policy("pro") == Policy(limit=100, interval=60)
+    assert await store.get_version() != version
+    await store.delete_policy("pro")
+    assert await store.get_policy("pro") is None
+
+
+@pytest.mark.asyncio
+async def test_policy_cache_resolve():
+    store = AsyncMock()
+    store.get_policy.side_effect = lambda name: Policy(limit=5, interval=1) if name == "tenant" else None
+    cache = PolicyCache(store, default=Policy(limit=1, interval=1), maxsize=2)
+    assert await cache.resolve("api-key", "tenant") == Policy(limit=5, interval=1)
+    assert await cache.resolve("api-key", "tenant") == Policy(limit=5, interval=1)
+    assert store.get_policy.await_count == 2
+    assert await cache.resolve("unknown") == Policy(limit=1, interval=1)
+    assert "api-key" not in cache._entries
+
+
+@pytest.mark.asyncio
+async def test_policy_cache_invalidated_on_new_version(sql_store: SQLPolicyStore):
+    await sql_store.set_policy("pro", Policy(limit=100, interval=60))
+    cache = PolicyCache(sql_store, poll_interval=0.05)
+    await cache.start()
+    try:
+        assert (await cache.get("pro")).limit == 100
+        await sql_store.set_policy("pro", Policy(limit=200, interval=60))
+        await asyncio.sleep(0.2)
+        assert (await cache.get("pro")).limit == 200
+    finally:
+        await cache.stop()
+
+
+@pytest.mark.asyncio
+async def test_sql_policy_store_concurrent_first_writes(sql_store: SQLPolicyStore):
+    await asyncio.gather(*(sql_store.set_policy(f"t{i}", Policy(limit=i, interval=60)) for i in range(5)))
+    assert await sql_store.get_version() == 5
+    assert await sql_store.get_policy("t3") == Policy(limit=3, interval=60)
+
+
+@pytest.mark.asyncio
+async def test_sql_policy_tables_not_in_rate_limit_db(tmpdir, sql_store: SQLPolicyStore):
+    storage = SQLiteStorage(db_path=str(tmpdir.join("limits.db")))
+    try:
+        with storage.engine.connect() as conn:
+            tables = {row[0] for row in conn.exec_driver_sql("SELECT name FROM sqlite_master WHERE type='table'")}
+    finally:
+        storage.close()
+    assert "sqlpolicy" not in tables
+    assert "sqlpolicyversion" not in tables
+
+
+@pytest.mark.asyncio
+async def test_policy_cache_invalidated_during_load():
+    loading = asyncio.Event()
+    release = asyncio.Event()
+    policies = {"x": Policy(limit=1, interval=1)}
+
+    async def get_policy(name):
+        policy = policies[name]
+        loading.set()
+        await release.wait()
+        return policy
+
+    store = AsyncMock()
+    store.get_policy.side_effect = get_policy
+    cache = PolicyCache(store)
+    pending = asyncio.create_task(cache.get("x"))
+    await loading.wait()
+    policies["x"] = Policy(limit=99, interval=1)
+    cache.invalidate(2)
+    release.set()
+    assert (await pending).limit == 1
+    assert (await cache.get("x")).limit == 99
+
+
+class FlakyPolicyStore(PolicyStore):
+    def __init__(self):
+        self.version = 1
+        self.attempts = 0
+        self.reads = 0
+
+    async def get_policy(self, name):
+        self.reads += 1
+        return Policy(limit=self.version, interval=1)
+
+    async def set_policy(self, name, policy): ...
+
+    async def delete_policy(self, name): ...
+
+    async def get_version(self):
+        return self.version
+
+    async def watch(self, poll_interval=1.0):
+        self.attempts += 1
+        yield self.version
+        if self.attempts == 1:
+            raise StorageError("Connection lost")
+        await asyncio.Event().wait()
+
+
+@pytest.mark.asyncio
+async def test_policy_cache_rewatches_after_failure(caplog):
+    store = FlakyPolicyStore()
+    cache = PolicyCache(store, poll_interval=0.05)
+    await cache.start()
+    try:
+        await asyncio.sleep(0.01)
+        assert (await cache.get("x")).limit == 1
+        store.version = 2
+        await asyncio.sleep(0.2)
+        assert store.attempts == 2
+        assert (await cache.get("x")).limit == 2
+        assert "Failed to watch the policy store" in caplog.text
+    finally:
+        await cache.stop()
+
+
+@pytest.mark.asyncio
+async def test_policy_cache_single_flight_misses():
+    release = asyncio.Event()
+
+    async def get_policy(name):
+        await release.wait()
+        return Policy(limit=5, interval=1)
+
+    store = AsyncMock()
+    store.get_policy.side_effect = get_policy
+    cache = PolicyCache(store)
+    pending = asyncio.gather(*(cache.get("x") for _ in range(10)))
+    await asyncio.sleep(0)
+    release.set()
+    assert {policy.limit for policy in await pending} == {5}
+    assert store.get_policy.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_policy_cache_expired_entry_reloaded_in_background():
+    store = AsyncMock()
+    store.get_policy.return_value = Policy(limit=1, interval=1)
+    cache = PolicyCache(store, ttl=0)
+    assert (await cache.get("x")).limit == 1
+    store.get_policy.return_value = Policy(limit=2, interval=1)
+    assert (await cache.get("x")).limit == 1
+    await asyncio.sleep(0)
+    assert (await cache.get("x")).limit == 2
+
+
+@pytest.mark.asyncio
+async def test_policy_cache_watching_serves_cached_entries():
+    store = FlakyPolicyStore()
+    store.attempts = 1
+    cache = PolicyCache(store, ttl=0)
+    await cache.start()
+    try:
+        await asyncio.sleep(0.01)
+        for _ in range(5):
+            assert (await cache.get("x")).limit == 1
+            await asyncio.sleep(0)
+        assert store.reads == 1
+    finally:
+        await cache.stop()
+
+
+def test_fast_limiter_applies_policy():
+    mock_storage = AsyncMock()
+    mock_storage.get_timestamp.return_value = 0.1
+    mock_storage.get_remaining.return_value = 2
+    store = AsyncMock()
+    store.get_policy.return_value = Policy(limit=50, interval=10)
+    limiter = FastLimiter(
+        mock_storage,
+        limit=3,
+        interval=5,
+        policies=PolicyCache(store),
+        policy_names=lambda request: [request.headers.get("x-api-key", "")],
+    )
+
+    app = FastAPI()
+
+    @app.get("/policy", dependencies=[Depends(limiter)])
+    async def policy_route():
+        return {"detail": "Welcome to policy route"}
+
+    client = TestClient(app)
+    assert client.get("/policy", headers={"x-api-key": "abc"}).status_code == 200
+    store.get_policy.assert_awaited_once_with("abc")
+    mock_storage.get_remaining.assert_awaited_once_with("testclient:/policy", 50, 10)
+
+
+def test_fast_limiter_default_policy_name_is_route_template():
+    mock_storage = AsyncMock()
+    mock_storage.get_timestamp.return_value = 0.1
+    mock_storage.get_remaining.return_value = 2
+    store = AsyncMock()
+    store.get_policy.return_value = Policy(limit=50, interval=10)
+    limiter = FastLimiter(mock_storage, limit=3, interval=5, policies=PolicyCache(store))
+
+    app = FastAPI()
+
+    @app.get("/users/{user_id}", dependencies=[Depends(limiter)])
+    async def user_route(user_id: int):
+        return {"detail": f"Welcome user {user_id}"}
+
+    client = TestClient(app)
+    for user_id in (1, 2, 3):
+        assert client.get(f"/users/{user_id}").status_code == 200
+    store.get_policy.assert_awaited_once_with("/users/{user_id}")
@@ -0,0 +1,51 @@
+import asyncio
+import pytest
+import pytest_asyncio
+from fast_limiter.policies import Policy, PolicyCache, RedisPolicyStore
+from fast_limiter.storages import RedisStorage
+
+
+@pytest_asyncio.fixture
+async def redis_store():
+    store = RedisPolicyStore(url="redis://localhost")
+    yield store
+    await store.db.flushall()
+    await store.db.aclose()
+
+
+@pytest.mark.asyncio
+async def test_redis_policy_set_get_delete(redis_store: RedisPolicyStore):
+    assert await redis_store.get_policy("pro") is None
+    await redis_store.set_policy("pro", Policy(limit=100, interval=60))
+    assert await redis_store.get_policy("pro") == Policy(limit=100, interval=60)
+    assert await redis_store.get_version() == 1
+    await redis_store.delete_policy("pro")
+    assert await redis_store.get_policy("pro") is None
+    assert await redis_store.get_version() == 2
+
+
+@pytest.mark.asyncio
+async def test_redis_policy_cache_invalidated_by_pubsub(redis_store: RedisPolicyStore):
+    await redis_store.set_policy("pro", Policy(limit=100, interval=60))
+    cache = PolicyCache(redis_store)
+    await cache.start()
+    try:
+        assert (await cache.get("pro")).limit == 100
+        await asyncio.sleep(0.1)
+        await redis_store.set_policy("pro", Policy(limit=200, interval=60))
+        await asyncio.sleep(0.1)
+        assert (await cache.get("pro")).limit == 200
+    finally:
+        await cache.stop()
+
+
+@pytest.mark.asyncio
+async def test_redis_policies_outside_storage_keys(redis_store: RedisPolicyStore):
+    await redis_store.set_policy("pro", Policy(limit=100, interval=60))
+    storage = RedisStorage(url="redis://localhost")
+    try:
+        assert [key async for key in storage.scan_keys()] == []
+        await storage.reset_many("*")
+    finally:
+        await storage.db.aclose()
+    assert await redis_store.get_policy("pro") == Policy(limit=100, interval=60)
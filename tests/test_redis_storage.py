@@ -1,3 +1,4 @@
+import asyncio
 import time
 import pytest
 import pytest_asyncio
@@ -43,3 +44,69 @@ async def test_redis_get_timestamp(key: str, redis_storage: RedisStorage):
     timestamp = await redis_storage.get_timestamp(key)
     assert timestamp is not None
     assert abs(time.time() - timestamp) < 1
+
+
+@pytest.mark.asyncio
+async def test_redis_scan_and_inspect(redis_storage: RedisStorage):
+    await redis_storage.increment("10.0.0.1:/a", 3)
+    await redis_storage.set_timestamp("10.0.0.1:/a")
+    await redis_storage.increment("10.0.0.1:/b", 1)
+    await redis_storage.increment("10.0.0.2:/a", 2)
+    keys = [key async for key in redis_storage.scan_keys("10.0.0.1:*", batch_size=1)]
+    assert sorted(keys) == ["10.0.0.1:/a", "10.0.0.1:/b"]
+    states = {state.key: state async for state in redis_storage.inspect("*:/a")}
+    assert states["10.0.0.1:/a"].count == 3
+    assert states["10.0.0.1:/a"].timestamp is not None
+    assert states["10.0.0.2:/a"].timestamp is None
+
+
+@pytest.mark.asyncio
+async def test_redis_reset_many(redis_storage: RedisStorage):
+    for path in ("/a", "/b", "/c"):
+        await redis_storage.increment(f"10.0.0.1:{path}")
+        await redis_storage.set_timestamp(f"10.0.0.1:{path}")
+    await redis_storage.increment("10.0.0.2:/a")
+    assert await redis_storage.reset_many("10.0.0.1:*", batch_size=2) == 3
+    assert [key async for key in redis_storage.scan_keys()] == ["10.0.0.2:/a"]
+    assert await redis_storage.get_timestamp("10.0.0.1:/a") is None
+
+
+@pytest.mark.asyncio
+async def test_redis_top_keys(redis_storage: RedisStorage):
+    for i, count in enumerate([4, 9, 1, 7]):
+        await redis_storage.increment(f"key{i}", count)
+    top = await redis_storage.top_keys(2)
+    assert [(state.key, state.count) for state in top] == [("key1", 9), ("key3", 7)]
+
+
+@pytest.mark.asyncio
+async def test_redis_export_import_state(redis_storage: RedisStorage):
+    await redis_storage.increment("a", 2)
+    await redis_storage.set_timestamp("a")
+    snapshot = [state async for state in redis_storage.export_state()]
+    await redis_storage.reset_many("*")
+    assert await redis_storage.import_state(snapshot) == 1
+    assert await redis_storage.get_remaining("a", 10, 60) == 8
+    assert await redis_storage.get_timestamp("a") == snapshot[0].timestamp
+
+
+@pytest.mark.asyncio
+async def test_redis_penalty(key: str, redis_storage: RedisStorage):
+    assert await redis_storage.add_strike(key, 60) == 1
+    assert await redis_storage.add_strike(key, 60) == 2
+    assert await redis_storage.get_bans() == {}
+    await redis_storage.add_ban(key, 60)
+    assert await redis_storage.add_strike(key, 60) == 0
+    await redis_storage.add_ban("10.0.0.1", -1)
+    assert await redis_storage.add_strike("10.0.0.1", 60) == 1
+    bans = await redis_storage.get_bans()
+    assert list(bans) == [key]
+    assert abs(bans[key] - time.time() - 60) < 1
+    assert [state async for state in redis_storage.inspect()] == []
+
+
+@pytest.mark.asyncio
+async def test_redis_strikes_expire(key: str, redis_storage: RedisStorage):
+    await redis_storage.add_strike(key, 1)
+    await asyncio.sleep(1.1)
+    assert await redis_storage.add_strike(key, 1) == 1
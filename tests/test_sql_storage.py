@@ -0,0 +1,108 @@
+import asyncio
+import time
+import pytest
+import pytest_asyncio
+from sqlalchemy.dialects import mysql, postgresql
+from sqlalchemy.schema import CreateTable
+from fast_limiter.storages import SQLStorage
+from fast_limiter.storages.sql import table
+
+
+@pytest_asyncio.fixture
+async def sql_storage(tmpdir):
+    db_path = str(tmpdir.join("rtl.db"))
+    storage = SQLStorage(url=f"sqlite+aiosqlite:///{db_path}")
+    yield storage
+    await storage.close()
+
+
+@pytest.mark.asyncio
+async def test_sql_increment(key: str, sql_storage: SQLStorage):
+    assert await sql_storage.increment(key) == 1
+    assert await sql_storage.increment(key, 5) == 6
+
+
+@pytest.mark.asyncio
+async def test_sql_concurrent_increment(key: str, sql_storage: SQLStorage):
+    await asyncio.gather(*(sql_storage.increment(key) for _ in range(10)))
+    assert await sql_storage.get_remaining(key, 20, 60) == 10
+
+
+@pytest.mark.asyncio
+async def test_sql_get_remaining(key: str, sql_storage: SQLStorage):
+    limit = 10
+    interval = 60
+    assert await sql_storage.get_remaining(key, limit, interval) == 10
+    await sql_storage.increment(key)
+    assert await sql_storage.get_remaining(key, limit, interval) == 9
+    await sql_storage.increment(key, 5)
+    assert await sql_storage.get_remaining(key, limit, interval) == 4
+
+
+@pytest.mark.asyncio
+async def test_sql_reset(key: str, sql_storage: SQLStorage):
+    limit = 10
+    interval = 60
+    await sql_storage.increment(key, 5)
+    assert await sql_storage.get_remaining(key, limit, interval) == 5
+    await sql_storage.reset(key)
+    assert await sql_storage.get_remaining(key, limit, interval) == 10
+
+
+@pytest.mark.asyncio
+async def test_sql_get_timestamp(key: str, sql_storage: SQLStorage):
+    assert await sql_storage.get_timestamp(key) is None
+    await sql_storage.set_timestamp(key)
+    timestamp = await sql_storage.get_timestamp(key)
+    assert timestamp is not None
+    assert abs(time.time() - timestamp) < 1
+
+
+@pytest.mark.asyncio
+async def test_sql_cleanup(sql_storage: SQLStorage):
+    await sql_storage.increment("old", 3)
+    await sql_storage.increment("older", 3)
+    await asyncio.sleep(0.2)
+    await sql_storage.increment("new")
+    assert await sql_storage.cleanup(interval=0.1, batch_size=1) == 2
+    assert [key async for key in sql_storage.scan_keys()] == ["new"]
+
+
+@pytest.mark.asyncio
+async def test_sql_admin(sql_storage: SQLStorage):
+    for i, count in enumerate([4, 9, 1, 7]):
+        await sql_storage.increment(f"10.0.0.{i}:/a", count)
+    top = await sql_storage.top_keys(2)
+    assert [(state.key, state.count) for state in top] == [("10.0.0.1:/a", 9), ("10.0.0.3:/a", 7)]
+    snapshot = [state async for state in sql_storage.export_state(batch_size=3)]
+    assert await sql_storage.reset_many("10.0.0.*", batch_size=3) == 4
+    assert await sql_storage.import_state(snapshot) == 4
+    assert await sql_storage.get_remaining("10.0.0.1:/a", 10, 60) == 1
+
+
+@pytest.mark.parametrize("dialect", [mysql.dialect(), postgresql.dialect()])
+def test_sql_timestamp_double_precision(dialect):
+    ddl = str(CreateTable(table).compile(dialect=dialect))
+    assert "timestamp DOUBLE" in ddl
+
+
+@pytest.mark.asyncio
+async def test_sql_penalty(key: str, sql_storage: SQLStorage):
+    assert await sql_storage.add_strike(key, 60) == 1
+    assert await sql_storage.add_strike(key, 60) == 2
+    assert await sql_storage.get_bans() == {}
+    await sql_storage.add_ban(key, 60)
+    assert await sql_storage.add_strike(key, 60) == 0
+    await sql_storage.add_ban("10.0.0.1", -1)
+    assert await sql_storage.add_strike("10.0.0.1", 60) == 1
+    bans = await sql_storage.get_bans()
+    assert list(bans) == [key]
+    assert abs(bans[key] - time.time() - 60) < 1
+    assert [state async for state in sql_storage.inspect()] == []
+
+
+@pytest.mark.asyncio
+async def test_sql_strikes_expire(key: str, sql_storage: SQLStorage):
+    await sql_storage.add_strike(key, 1)
+    await asyncio.sleep(1.1)
+    assert await sql_storage.add_strike(key, 1) == 1
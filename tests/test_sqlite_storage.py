@@ -1,3 +1,4 @@
+import asyncio
 import time
 import pytest
 import pytest_asyncio
@@ -44,3 +45,66 @@ async def test_get_timestamp(key: str, sql_storage: SQLiteStorage):
     timestamp = await sql_storage.get_timestamp(key)
     assert timestamp is not None
     assert abs(time.time() - timestamp) < 1
+
+
+@pytest.mark.asyncio
+async def test_sqlite_scan_and_inspect(sql_storage: SQLiteStorage):
+    await sql_storage.increment("10.0.0.1:/a", 3)
+    await sql_storage.increment("10.0.0.1:/b", 1)
+    await sql_storage.increment("10.0.0.2:/a", 2)
+    keys = [key async for key in sql_storage.scan_keys("10.0.0.1:*", batch_size=1)]
+    assert keys == ["10.0.0.1:/a", "10.0.0.1:/b"]
+    states = [state async for state in sql_storage.inspect("*:/a")]
+    assert {(state.key, state.count) for state in states} == {("10.0.0.1:/a", 3), ("10.0.0.2:/a", 2)}
+
+
+@pytest.mark.asyncio
+async def test_sqlite_reset_many(sql_storage: SQLiteStorage):
+    for path in ("/a", "/b", "/c"):
+        await sql_storage.increment(f"10.0.0.1:{path}")
+    await sql_storage.increment("10.0.0.2:/a")
+    assert await sql_storage.reset_many("10.0.0.1:*", batch_size=2) == 3
+    assert [key async for key in sql_storage.scan_keys()] == ["10.0.0.2:/a"]
+
+
+@pytest.mark.asyncio
+async def test_sqlite_top_keys(sql_storage: SQLiteStorage):
+    for i, count in enumerate([4, 9, 1, 7]):
+        await sql_storage.increment(f"key{i}", count)
+    top = await sql_storage.top_keys(2)
+    assert [(state.key, state.count) for state in top] == [("key1", 9), ("key3", 7)]
+
+
+@pytest.mark.asyncio
+async def test_sqlite_export_import_state(sql_storage: SQLiteStorage, tmpdir):
+    await sql_storage.increment("a", 2)
+    await sql_storage.increment("b", 5)
+    target = SQLiteStorage(db_path=str(tmpdir.join("copy.db")))
+    try:
+        assert await target.import_state(sql_storage.export_state(), batch_size=1) == 2
+        assert await target.get_remaining("b", 10, 60) == 5
+        assert await target.get_timestamp("a") == await sql_storage.get_timestamp("a")
+    finally:
+        target.close()
+
+
+@pytest.mark.asyncio
+async def test_sqlite_penalty(key: str, sql_storage: SQLiteStorage):
+    assert await sql_storage.add_strike(key, 60) == 1
+    assert await sql_storage.add_strike(key, 60) == 2
+    assert await sql_storage.get_bans() == {}
+    await sql_storage.add_ban(key, 60)
+    assert await sql_storage.add_strike(key, 60) == 0
+    await sql_storage.add_ban("10.0.0.1", -1)
+    assert await sql_storage.add_strike("10.0.0.1", 60) == 1
+    bans = await sql_storage.get_bans()
+    assert list(bans) == [key]
+    assert abs(bans[key] - time.time() - 60) < 1
+    assert [state async for state in sql_storage.inspect()] == []
+
+
+@pytest.mark.asyncio
+async def test_sqlite_strikes_expire(key: str, sql_storage: SQLiteStorage):
+    await sql_storage.add_strike(key, 1)
+    await asyncio.sleep(1.1)
+    assert await sql_storage.add_strike(key, 1) == 1
@@ -0,0 +1,59 @@
+import pytest
+from fastapi.testclient import TestClient
+from fastapi import FastAPI, WebSocket
+from starlette.status import WS_1008_POLICY_VIOLATION
+from starlette.websockets import WebSocketDisconnect
+from fast_limiter import WebSocketLimiter
+from unittest.mock import AsyncMock
+
+app = FastAPI()
+
+mock_storage = AsyncMock()
+mock_storage.get_timestamp.return_value = None
+mock_storage.get_remaining.return_value = 100
+
+limiter = WebSocketLimiter(mock_storage, limit=100, interval=60, connection_limit=3, sync_interval=60)
+
+
+@app.websocket("/ws-rate-limit")
+async def websocket_rate_limit_route(websocket: WebSocket):
+    await websocket.accept()
+    async with limiter.connect(websocket) as connection:
+        while True:
+            message = await websocket.receive_text()
+            await connection()
+            await websocket.send_text(message)
+
+
+client = TestClient(app)
+
+
+@pytest.mark.asyncio
+async def test_websocket_limit_connection_exceed_limit():
+    mock_storage.reset_mock()
+    mock_storage.get_remaining.return_value = 100
+    with client.websocket_connect("/ws-rate-limit") as websocket:
+        for i in range(3):
+            websocket.send_text(str(i))
+            assert websocket.receive_text() == str(i)
+        websocket.send_text("over")
+        with pytest.raises(WebSocketDisconnect) as exc_info:
+            websocket.receive_text()
+    assert exc_info.value.code == WS_1008_POLICY_VIOLATION
+    assert mock_storage.get_remaining.await_count == 1
+    mock_storage.increment.assert_awaited_once_with("testclient:/ws-rate-limit", 3)
+
+
+@pytest.mark.asyncio
+async def test_websocket_limit_key_exceed_limit():
+    mock_storage.get_remaining.return_value = 1
+    try:
+        with client.websocket_connect("/ws-rate-limit") as websocket:
+            websocket.send_text("first")
+            assert websocket.receive_text() == "first"
+            websocket.send_text("second")
+            with pytest.raises(WebSocketDisconnect) as exc_info:
+                websocket.receive_text()
+    finally:
+        mock_storage.get_remaining.return_value = 100
+    assert exc_info.value.code == WS_1008_POLICY_VIOLATION